@@ -454,14 +454,19 @@ class Ass:
         self.__output = []
         self.__output_extradata = []
 
+        # Reading the whole file at once, subtitle files are small enough
+        with open(self.path_input, "r", encoding="utf-8-sig") as f:
+            input_lines = f.readlines()
+
         section = ""
+        section_pattern = re.compile(r"^\[([^\]]*)")
         li = 0
-        for line in open(self.path_input, "r", encoding="utf-8-sig"):
+        for line in input_lines:
             # Getting section
-            section_pattern = re.compile(r"^\[([^\]]*)")
-            if section_pattern.match(line):
+            section_match = section_pattern.match(line)
+            if section_match:
                 # Updating section
-                section = section_pattern.match(line)[1]
+                section = section_match[1]
                 # Appending line to output
                 if section != "Aegisub Extradata":
                     self.__output.append(line)
@@ -17,13 +17,135 @@
 
 from __future__ import annotations
 import re
-from typing import List, Union, TYPE_CHECKING
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
+from typing import Iterable, List, Optional, Tuple, Union, TYPE_CHECKING
 from video_timestamps import ABCTimestamps, TimeType
 
 from .convert import Convert, ColorModel
 
 if TYPE_CHECKING:
-    from .ass_core import Line, Word, Syllable, Char
+    from .ass_core import Style, Line, Word, Syllable, Char
+
+# Regular expressions used by ColorUtility to find color changes
+_TAG_ALL = re.compile(r"{.*?}")
+_TAG_T = re.compile(r"\\t\( *?(-?\d+?) *?, *?(-?\d+?) *?, *(.+?) *?\)")
+_TAG_C = re.compile(r"\\([134])c(&H.{6}&)")
+
+# Maximum number of results kept by ColorUtility.get_fr_color_change
+_FR_COLORS_CACHE_SIZE = 1024
+
+
+def _search_colors(text: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    # Returns the first \1c, \3c and \4c tags found in text (None if missing), in a single scan
+    colors = {}
+    for match in _TAG_C.finditer(text):
+        colors.setdefault(match[1], match[0])
+    return colors.get("1"), colors.get("3"), colors.get("4")
+
+
+def _split_transforms(tag: str) -> Tuple[str, List[Tuple[str, str, str]]]:
+    # Splits a tag in the text outside of its \t(...) and the (start, end, body) of each \t(...),
+    # equivalent to _TAG_T.sub("", tag) and _TAG_T.findall(tag) but scanning the tag only once
+    if "\\t(" not in tag:
+        return tag, []
+
+    other_tags = []
+    transforms = []
+    last = 0
+    for match in _TAG_T.finditer(tag):
+        other_tags.append(tag[last : match.start()])
+        transforms.append(match.groups())
+        last = match.end()
+    other_tags.append(tag[last:])
+    return "".join(other_tags), transforms
+
+
+def _interpolate_numbers(pct: float, val1: float, val2: float) -> float:
+    return val1 + (val2 - val1) * pct
+
+
+@lru_cache(maxsize=256)
+def _parse_ass_pair(val1: str, val2: str) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    # Splits two ASS alphas, colors or colors+alpha in their channels.
+    # Cached, since the same pair is usually interpolated over many frames
+    length = len(val1)
+    if length != len(val2):
+        raise ValueError(
+            "ASS values must have the same type (either two alphas, two colors or two colors+alpha)."
+        )
+    if length == len("&HXX&"):
+        return (Convert.alpha_ass_to_dec(val1),), (Convert.alpha_ass_to_dec(val2),)
+    elif length == len("&HBBGGRR&"):
+        return Convert.color_ass_to_rgb(val1), Convert.color_ass_to_rgb(val2)
+    elif length == len("&HAABBGGRR"):
+        return (
+            Convert.color(val1, ColorModel.ASS_STYLE, ColorModel.RGBA),
+            Convert.color(val2, ColorModel.ASS_STYLE, ColorModel.RGBA),
+        )
+    else:
+        raise ValueError(
+            f"Provided inputs '{val1}' and '{val2}' are not valid ASS strings."
+        )
+
+
+def _format_ass(channels: Tuple[float, ...]) -> str:
+    # Inverse of _parse_ass_pair, for a single value.
+    # Colors are formatted without Convert, but their range is still checked the same way,
+    # as a negative acceleration can push the channels outside of it
+    if len(channels) == 1:
+        return Convert.alpha_dec_to_ass(channels[0])
+    if not all(0 <= n <= 255 for n in channels):
+        color_model = ColorModel.RGB if len(channels) == 3 else ColorModel.RGBA
+        raise ValueError(
+            f"Provided input '{channels}' is not in the format '{color_model}'."
+        )
+    if len(channels) == 3:
+        r, g, b = channels
+        return f"&H{round(b):02X}{round(g):02X}{round(r):02X}&"
+    else:
+        r, g, b, a = channels
+        return f"&H{round(a):02X}{round(b):02X}{round(g):02X}{round(r):02X}"
+
+
+def _interpolate_ass(pct: float, val1: str, val2: str) -> str:
+    # Channels are interpolated one by one, as their number is known for each ASS value type
+    channels1, channels2 = _parse_ass_pair(val1, val2)
+    if len(channels1) == 3:
+        if 0.0 <= pct <= 1.0:
+            # Channels can't leave the range of the interpolated ones, so no check is needed
+            return Utils.interpolate_rgb(pct, channels1, channels2)
+        r1, g1, b1 = channels1
+        r2, g2, b2 = channels2
+        return _format_ass(
+            (r1 + (r2 - r1) * pct, g1 + (g2 - g1) * pct, b1 + (b2 - b1) * pct)
+        )
+    elif len(channels1) == 1:
+        return Convert.alpha_dec_to_ass(
+            channels1[0] + (channels2[0] - channels1[0]) * pct
+        )
+    else:
+        r1, g1, b1, a1 = channels1
+        r2, g2, b2, a2 = channels2
+        return _format_ass(
+            (
+                r1 + (r2 - r1) * pct,
+                g1 + (g2 - g1) * pct,
+                b1 + (b2 - b1) * pct,
+                a1 + (a2 - a1) * pct,
+            )
+        )
+
+
+# Interpolation function to use for each accepted pair of input types
+_INTERPOLATORS = {
+    (int, int): _interpolate_numbers,
+    (int, float): _interpolate_numbers,
+    (float, int): _interpolate_numbers,
+    (float, float): _interpolate_numbers,
+    (str, str): _interpolate_ass,
+}
 
 
 class Utils:
@@ -44,16 +166,66 @@ class Utils:
         Returns:
             A list containing lines_chars_syls_or_words without objects with duration equals to zero or blank text (no text or only spaces).
         """
-        out = []
-        for obj in lines_chars_syls_or_words:
-            if obj.text.strip() and obj.duration > 0:
-                out.append(obj)
-        return out
+        return [
+            obj
+            for obj in lines_chars_syls_or_words
+            if obj.duration > 0 and obj.text and not obj.text.isspace()
+        ]
 
     @staticmethod
     def clean_tags(text: str) -> str:
-        # TODO: Cleans up ASS subtitle lines of badly-formed override. Returns a cleaned up text.
-        pass
+        """
+        Cleans up the override blocks of an ASS text: adjacent blocks are merged into one,
+        empty blocks are removed and stray ``{`` inside a block are dropped.
+        Comment blocks (not starting with ``\\``) are kept apart, so tag arguments aren't altered.
+        Unclosed blocks are left untouched, as renderers show them as plain text.
+
+        Parameters:
+            text (str): The text to clean up (e.g. the ``raw_text`` of a line).
+
+        Returns:
+            The cleaned up text.
+
+        Examples:
+            ..  code-block:: python3
+
+                print( Utils.clean_tags("{\\b1}{}{\\i1}Hello{}{\\b0}") )
+
+            >>> {\\b1\\i1}Hello{\\b0}
+        """
+        parts = []
+        tags = ""
+        i = 0
+
+        # Single pass over the text, jumping from brace to brace
+        while True:
+            start = text.find("{", i)
+            end = text.find("}", start + 1) if start != -1 else -1
+            if end == -1:
+                break
+
+            # Some text is found before this block, so the pending tags can't be merged further
+            if start > i:
+                if tags:
+                    parts.append("{" + tags + "}")
+                    tags = ""
+                parts.append(text[i:start])
+
+            block = text[start + 1 : end].replace("{", "")
+            if block.startswith("\\"):
+                tags += block
+            elif block:
+                # Comments can't be merged, as they would become part of the previous tag's argument
+                if tags:
+                    parts.append("{" + tags + "}")
+                    tags = ""
+                parts.append("{" + block + "}")
+            i = end + 1
+
+        if tags:
+            parts.append("{" + tags + "}")
+        parts.append(text[i:])
+        return "".join(parts)
 
     @staticmethod
     def accelerate(pct: float, accelerator: float) -> float:
@@ -97,45 +269,115 @@ class Utils:
                 f"Percent value must be a float between 0.0 and 1.0, but yours was {pct}"
             )
 
+        # Finding the right interpolation for the given types
+        try:
+            interpolate_values = _INTERPOLATORS[type(val1), type(val2)]
+        except KeyError:
+            raise TypeError(
+                "Invalid input(s) type, either pass two strings or two numbers."
+            ) from None
+
         # Calculating acceleration (if requested)
         pct = Utils.accelerate(pct, acc) if acc != 1.0 else pct
 
-        def interpolate_numbers(val1, val2):
-            nonlocal pct
-            return val1 + (val2 - val1) * pct
+        # ASS strings at the boundaries don't need any computation (common at the start and end of transformations),
+        # they are only validated (parsing is cached, so this is cheap)
+        if interpolate_values is _interpolate_ass and (pct == 0.0 or pct == 1.0):
+            _parse_ass_pair(val1, val2)
+            return val1 if pct == 0.0 else val2
 
-        # Interpolating
-        if type(val1) is str and type(val2) is str:
-            if len(val1) != len(val2):
-                raise ValueError(
-                    "ASS values must have the same type (either two alphas, two colors or two colors+alpha)."
-                )
-            if len(val1) == len("&HXX&"):
-                val1 = Convert.alpha_ass_to_dec(val1)
-                val2 = Convert.alpha_ass_to_dec(val2)
-                a = interpolate_numbers(val1, val2)
-                return Convert.alpha_dec_to_ass(a)
-            elif len(val1) == len("&HBBGGRR&"):
-                val1 = Convert.color_ass_to_rgb(val1)
-                val2 = Convert.color_ass_to_rgb(val2)
-                rgb = tuple(map(interpolate_numbers, val1, val2))
-                return Convert.color_rgb_to_ass(rgb)
-            elif len(val1) == len("&HAABBGGRR"):
-                val1 = Convert.color(val1, ColorModel.ASS, ColorModel.RGBA)
-                val2 = Convert.color(val2, ColorModel.ASS, ColorModel.RGBA)
-                rgba = tuple(map(interpolate_numbers, val1, val2))
-                return Convert.color(rgba, ColorModel.RGBA, ColorModel.ASS)
-            else:
+        return interpolate_values(pct, val1, val2)
+
+    @staticmethod
+    def interpolate_rgb(
+        pct: float,
+        rgb1: Tuple[Union[int, float], Union[int, float], Union[int, float]],
+        rgb2: Tuple[Union[int, float], Union[int, float], Union[int, float]],
+    ) -> str:
+        """
+        | Interpolates 2 given RGB colors by percent value as decimal number, returning an ASS color.
+        | It is a faster alternative to :meth:`interpolate` for tight loops, where the colors can be converted once with :meth:`Convert.color_ass_to_rgb`.
+        | Inputs are not validated, so make sure to provide a percent value between 0.0 and 1.0 and colors in the range *[0, 255]*.
+
+        Parameters:
+            pct (float): Percent value of the interpolation.
+            rgb1 (tuple of int or tuple of float): First RGB color to interpolate.
+            rgb2 (tuple of int or tuple of float): Second RGB color to interpolate.
+
+        Returns:
+            A string in the format '&HBBGGRR&' representing the interpolated color.
+
+        Examples:
+            ..  code-block:: python3
+
+                rgb1 = Convert.color_ass_to_rgb("&H000000&")
+                rgb2 = Convert.color_ass_to_rgb("&HFFFFFF&")
+                print( Utils.interpolate_rgb(0.9, rgb1, rgb2) )
+
+            >>> &HE6E6E6&
+        """
+        r1, g1, b1 = rgb1
+        r2, g2, b2 = rgb2
+        r = round(r1 + (r2 - r1) * pct)
+        g = round(g1 + (g2 - g1) * pct)
+        b = round(b1 + (b2 - b1) * pct)
+        return f"&H{b:02X}{g:02X}{r:02X}&"
+
+    @staticmethod
+    def interpolate_many(
+        pcts: Iterable[float],
+        val1: Union[float, str],
+        val2: Union[float, str],
+        acc: float = 1.0,
+    ) -> List[Union[str, float]]:
+        """
+        | Interpolates 2 given values (ASS colors, ASS alpha channels or numbers) for every percent value in ``pcts``.
+        | The result is the same as calling :meth:`interpolate` once per percent value, but the given values are parsed only once.
+        |
+        | You could use that to precompute a whole color/alpha gradient.
+
+        Parameters:
+            pcts (iterable of float): Percent values of the interpolation.
+            val1 (int, float or str): First value to interpolate (either string or number).
+            val2 (int, float or str): Second value to interpolate (either string or number).
+            acc (float, optional): Optional acceleration that influences final percent values.
+
+        Returns:
+            A list containing the interpolated value of given 2 values for each percent value.
+
+        Examples:
+            ..  code-block:: python3
+
+                print( Utils.interpolate_many([0, 0.5, 1], "&H000000&", "&HFFFFFF&") )
+
+            >>> ['&H000000&', '&H808080&', '&HFFFFFF&']
+        """
+        pcts = list(pcts)
+        for pct in pcts:
+            if pct > 1.0 or pct < 0:
                 raise ValueError(
-                    f"Provided inputs '{val1}' and '{val2}' are not valid ASS strings."
+                    f"Percent value must be a float between 0.0 and 1.0, but yours was {pct}"
                 )
-        elif type(val1) in [int, float] and type(val2) in [int, float]:
-            return interpolate_numbers(val1, val2)
-        else:
+
+        interpolate_values = _INTERPOLATORS.get((type(val1), type(val2)))
+        if interpolate_values is None:
             raise TypeError(
                 "Invalid input(s) type, either pass two strings or two numbers."
             )
 
+        # Calculating acceleration (if requested)
+        if acc != 1.0:
+            pcts = [Utils.accelerate(pct, acc) for pct in pcts]
+
+        if interpolate_values is _interpolate_numbers:
+            return [_interpolate_numbers(pct, val1, val2) for pct in pcts]
+
+        channels = tuple(zip(*_parse_ass_pair(val1, val2)))
+        return [
+            _format_ass(tuple(_interpolate_numbers(pct, v1, v2) for v1, v2 in channels))
+            for pct in pcts
+        ]
+
 
 class FrameUtility:
     """This class allows to accurately work in a frame per frame environment.
@@ -190,6 +432,21 @@ class FrameUtility:
         - Works reliably for both CFR and VFR videos
     """
 
+    __slots__ = (
+        "timestamps",
+        "start_ms",
+        "end_ms",
+        "start_fr",
+        "curr_fr",
+        "end_fr",
+        "end_ms_snapped",
+        "n_fr",
+        "i",
+        "n",
+        "_frames",
+        "_frame_times",
+    )
+
     def __init__(
         self,
         start_ms: int,
@@ -219,21 +476,33 @@ class FrameUtility:
         self.n_fr = n_fr
         self.i = 0
         self.n = self.end_fr - self.start_fr + 1
+        self._frames = None
+        self._frame_times = {}
 
     def __iter__(self):
-        # Generate values for the frames on demand. The end time is always clamped to the end_ms value.
-        for self.i in range(0, self.n, self.n_fr):
-            yield (
-                self.timestamps.frame_to_time(self.curr_fr, TimeType.START, 3, True),
-                min(
-                    self.timestamps.frame_to_time(
-                        self.curr_fr + self.n_fr - 1, TimeType.END, 3, True
+        # Frame values are computed on the first iteration only, later iterations reuse them.
+        # The end time is always clamped to the end_ms value.
+        if self._frames is None:
+            frame_to_time = self.timestamps.frame_to_time
+            start_fr, n_fr, n = self.start_fr, self.n_fr, self.n
+            end_ms_snapped = self.end_ms_snapped
+            self._frames = [
+                (
+                    frame_to_time(start_fr + i, TimeType.START, 3, True),
+                    min(
+                        frame_to_time(start_fr + i + n_fr - 1, TimeType.END, 3, True),
+                        end_ms_snapped,
                     ),
-                    self.end_ms_snapped,
-                ),
-                self.i + 1,
-                self.n,
-            )
+                    i + 1,
+                    n,
+                )
+                for i in range(0, n, n_fr)
+            ]
+
+        # Generate values for the frames
+        for frame in self._frames:
+            self.i = frame[2] - 1
+            yield frame
             self.curr_fr += self.n_fr
 
         # Reset the object to make it usable again
@@ -290,18 +559,25 @@ class FrameUtility:
             >>> Frame 3/4: 125 - 175; fsc: 137.5
             >>> Frame 4/4: 175 - 225; fsc: 112.5
         """
-        curr_ms = self.timestamps.frame_to_time(
-            self.i + (self.n_fr - 1) // 2, TimeType.END, 3, True
-        )
+        # The current time is computed once per frame, as add is often called several times in it
+        # (and the same frames are met again if the object is iterated again)
+        frame = self.i + (self.n_fr - 1) // 2
+        curr_ms = self._frame_times.get(frame)
+        if curr_ms is None:
+            curr_ms = self._frame_times[frame] = self.timestamps.frame_to_time(
+                frame, TimeType.END, 3, True
+            )
 
         if curr_ms <= start_time:
             return 0
         elif curr_ms >= end_time:
             return end_value
 
-        curr = curr_ms - start_time
-        total = end_time - start_time
-        return Utils.interpolate(curr / total, 0, end_value, accelerator)
+        # Here 0 < pct < 1, so Utils.interpolate's checks and dispatch are not needed
+        pct = (curr_ms - start_time) / (end_time - start_time)
+        if accelerator != 1.0:
+            pct = Utils.accelerate(pct, accelerator)
+        return end_value * pct
 
 
 class ColorUtility:
@@ -352,108 +628,197 @@ class ColorUtility:
             CU = ColorUtility([ line[0] ])
     """
 
+    __slots__ = (
+        "_starts",
+        "_ends",
+        "_accs",
+        "_c1s",
+        "_c3s",
+        "_c4s",
+        "_base_colors",
+        "_rgbs",
+        "_fr_colors",
+        "_ends_in_order",
+        "_ends_after_starts",
+        "_last_c1s",
+        "_last_c3s",
+        "_last_c4s",
+        "c1_req",
+        "c3_req",
+        "c4_req",
+    )
+
     def __init__(self, lines: List[Line], offset: int = 0):
-        self.color_changes = []
+        # Color changes are stored as parallel lists, one item per color change
+        self._starts = []
+        self._ends = []
+        self._accs = []
+        self._c1s = []
+        self._c3s = []
+        self._c4s = []
+        # Default color tags of the styles met so far, keyed by their colors
+        self._base_colors = {}
+        # RGB values of the colors interpolated so far, to convert each color only once
+        self._rgbs = {}
+        # Results of get_fr_color_change already computed (at most _FR_COLORS_CACHE_SIZE)
+        self._fr_colors = {}
         self.c1_req = False
         self.c3_req = False
         self.c4_req = False
 
-        # Compiling regex
-        tag_all = re.compile(r"{.*?}")
-        tag_t = re.compile(r"\\t\( *?(-?\d+?) *?, *?(-?\d+?) *?, *(.+?) *?\)")
-        tag_c1 = re.compile(r"\\1c(&H.{6}&)")
-        tag_c3 = re.compile(r"\\3c(&H.{6}&)")
-        tag_c4 = re.compile(r"\\4c(&H.{6}&)")
-
         for line in lines:
             # Obtaining all tags enclosured in curly brackets
-            tags = tag_all.findall(line.raw_text)
+            tags = _TAG_ALL.findall(line.raw_text)
+
+            # Time all the color changes of this line are relative to
+            line_start = line.start_time + offset
 
             # Let's search all color changes in the tags
             for tag in tags:
+                # Colors always contain "&", so tags without it and without \t can be skipped
+                if "&" not in tag and "\\t(" not in tag:
+                    continue
+
                 # Get everything beside \t to see if there are some colors there
-                other_tags = tag_t.sub("", tag)
+                other_tags, ts = _split_transforms(tag)
 
                 # Searching for colors in the other tags
-                c1, c3, c4 = (
-                    tag_c1.search(other_tags),
-                    tag_c3.search(other_tags),
-                    tag_c4.search(other_tags),
-                )
+                c1, c3, c4 = _search_colors(other_tags)
 
                 # If we found something, add to the list as a color change
                 if c1 or c3 or c4:
                     if c1:
-                        c1 = c1.group(0)
                         self.c1_req = True
                     if c3:
-                        c3 = c3.group(0)
                         self.c3_req = True
                     if c4:
-                        c4 = c4.group(0)
                         self.c4_req = True
 
-                    self.color_changes.append(
-                        {
-                            "start": line.start_time + offset,
-                            "end": line.start_time + offset,
-                            "acc": 1,
-                            "c1": c1,
-                            "c3": c3,
-                            "c4": c4,
-                        }
+                    self._add_color_change(
+                        line_start,
+                        line_start,
+                        1,
+                        c1,
+                        c3,
+                        c4,
                     )
 
-                # Find all transformation in tag
-                ts = tag_t.findall(tag)
-
                 # Working with each transformation
                 for t in ts:
                     # Parsing start, end, optional acceleration and colors
                     start, end, acc_colors = int(t[0]), int(t[1]), t[2].split(",")
-                    acc, c1, c3, c4 = 1, None, None, None
-
-                    # Do we have also acceleration?
-                    if len(acc_colors) == 1:
-                        c1, c3, c4 = (
-                            tag_c1.search(acc_colors[0]),
-                            tag_c3.search(acc_colors[0]),
-                            tag_c4.search(acc_colors[0]),
-                        )
-                    elif len(acc_colors) == 2:
-                        acc = float(acc_colors[0])
-                        c1, c3, c4 = (
-                            tag_c1.search(acc_colors[1]),
-                            tag_c3.search(acc_colors[1]),
-                            tag_c4.search(acc_colors[1]),
-                        )
-                    else:
+                    if len(acc_colors) > 2:
                         # This transformation is malformed (too many ','), let's skip this
                         continue
 
-                    # If found, extract from groups
+                    # Do we have also acceleration? Colors are always in the last part
+                    acc = float(acc_colors[0]) if len(acc_colors) == 2 else 1
+                    c1, c3, c4 = _search_colors(acc_colors[-1])
+
                     if c1:
-                        c1 = c1.group(0)
                         self.c1_req = True
                     if c3:
-                        c3 = c3.group(0)
                         self.c3_req = True
                     if c4:
-                        c4 = c4.group(0)
                         self.c4_req = True
 
                     # Saving in the list
-                    self.color_changes.append(
-                        {
-                            "start": line.start_time + start + offset,
-                            "end": line.start_time + end + offset,
-                            "acc": acc,
-                            "c1": c1,
-                            "c3": c3,
-                            "c4": c4,
-                        }
+                    self._add_color_change(
+                        line_start + start,
+                        line_start + end,
+                        acc,
+                        c1,
+                        c3,
+                        c4,
                     )
 
+        # Sorting color changes by start time (keeping the .ass order for equal ones),
+        # so that they are always applied in temporal order
+        order = sorted(range(len(self._starts)), key=self._starts.__getitem__)
+        for values in (
+            self._starts,
+            self._ends,
+            self._accs,
+            self._c1s,
+            self._c3s,
+            self._c4s,
+        ):
+            values[:] = [values[i] for i in order]
+
+        # If color changes also end in order, the ones ended before a given time are a prefix of the lists:
+        # it can be found with a binary search, and the last colors set in it are precomputed here
+        self._ends_in_order = all(a <= b for a, b in zip(self._ends, self._ends[1:]))
+        # If no color change ends before its start, the ones starting after a line's end can be ignored
+        self._ends_after_starts = all(a <= b for a, b in zip(self._starts, self._ends))
+        self._last_c1s = list(accumulate(self._c1s, lambda last, c: c or last))
+        self._last_c3s = list(accumulate(self._c3s, lambda last, c: c or last))
+        self._last_c4s = list(accumulate(self._c4s, lambda last, c: c or last))
+
+    def _add_color_change(
+        self,
+        start: int,
+        end: int,
+        acc: float,
+        c1: Optional[str],
+        c3: Optional[str],
+        c4: Optional[str],
+    ):
+        self._starts.append(start)
+        self._ends.append(end)
+        self._accs.append(acc)
+        self._c1s.append(c1)
+        self._c3s.append(c3)
+        self._c4s.append(c4)
+
+    def _get_base_colors(self, style: Style) -> Tuple[str, str, str]:
+        colors = (style.color1, style.color3, style.color4)
+        base_colors = self._base_colors.get(colors)
+        if base_colors is None:
+            base_colors = self._base_colors[colors] = (
+                "\\1c" + style.color1,
+                "\\3c" + style.color3,
+                "\\4c" + style.color4,
+            )
+        return base_colors
+
+    def _interpolate_color(
+        self, pct: float, color1: str, color2: str, acc: float
+    ) -> str:
+        # Same as Utils.interpolate on the "&HBBGGRR&" part of two color tags of the same kind,
+        # but working on (and returning) whole color tags, to avoid slicing them at every call
+        if color1 is None or color2 is None:
+            raise TypeError("Cannot interpolate a missing color.")
+        if acc != 1.0:
+            pct = Utils.accelerate(pct, acc)
+        if pct == 0.0:
+            return color1
+        if pct == 1.0:
+            return color2
+
+        rgbs = self._rgbs
+        rgb1 = rgbs.get(color1)
+        if rgb1 is None:
+            rgb1 = rgbs[color1] = Convert.color_ass_to_rgb(color1[3:])
+        rgb2 = rgbs.get(color2)
+        if rgb2 is None:
+            rgb2 = rgbs[color2] = Convert.color_ass_to_rgb(color2[3:])
+        if not 0.0 <= pct <= 1.0:
+            # A negative acceleration can push the channels out of range, so they must be checked
+            return color2[:3] + _format_ass(
+                tuple(c1 + (c2 - c1) * pct for c1, c2 in zip(rgb1, rgb2))
+            )
+        return color2[:3] + Utils.interpolate_rgb(pct, rgb1, rgb2)
+
+    @property
+    def color_changes(self) -> List[dict]:
+        """List of all the color changes found, each one as a dictionary with keys start, end, acc, c1, c3 and c4."""
+        return [
+            {"start": start, "end": end, "acc": acc, "c1": c1, "c3": c3, "c4": c4}
+            for start, end, acc, c1, c3, c4 in zip(
+                self._starts, self._ends, self._accs, self._c1s, self._c3s, self._c4s
+            )
+        ]
+
     def get_color_change(
         self, line: Line, c1: bool = None, c3: bool = None, c4: bool = None
     ) -> str:
@@ -492,26 +857,45 @@ class ColorUtility:
             c3 = self.c3_req
         if c4 is None:
             c4 = self.c4_req
+        if not (c1 or c3 or c4):
+            return ""
 
         # Reading default colors
-        base_c1 = "\\1c" + line.styleref.color1
-        base_c3 = "\\3c" + line.styleref.color3
-        base_c4 = "\\4c" + line.styleref.color4
-
-        for color_change in self.color_changes:
-            if color_change["end"] <= line.start_time:
+        base_c1, base_c3, base_c4 = self._get_base_colors(line.styleref)
+
+        # Narrowing the color changes to scan, when they are in order
+        first, last = 0, len(self._starts)
+        if self._ends_in_order:
+            first = bisect_right(self._ends, line.start_time)
+            if first > 0:
+                base_c1 = self._last_c1s[first - 1] or base_c1
+                base_c3 = self._last_c3s[first - 1] or base_c3
+                base_c4 = self._last_c4s[first - 1] or base_c4
+        if self._ends_in_order or (
+            self._ends_after_starts and line.start_time <= line.end_time
+        ):
+            last = max(first, bisect_right(self._starts, line.end_time))
+
+        for i in range(first, last):
+            start, end, acc = self._starts[i], self._ends[i], self._accs[i]
+            change_c1, change_c3, change_c4 = self._c1s[i], self._c3s[i], self._c4s[i]
+            if end <= line.start_time:
                 # Get base colors from this color change, since it is before my current line
-                # Last color change written in .ass wins
-                if color_change["c1"]:
-                    base_c1 = color_change["c1"]
-                if color_change["c3"]:
-                    base_c3 = color_change["c3"]
-                if color_change["c4"]:
-                    base_c4 = color_change["c4"]
-            elif color_change["start"] <= line.end_time:
+                # Latest color change wins
+                if change_c1:
+                    base_c1 = change_c1
+                if change_c3:
+                    base_c3 = change_c3
+                if change_c4:
+                    base_c4 = change_c4
+            elif start <= line.end_time:
+                # Skipping color changes with none of the requested colors, they would be empty transforms
+                if not ((c1 and change_c1) or (c3 and change_c3) or (c4 and change_c4)):
+                    continue
+
                 # We have found a valid color change, append it to the transform
-                start_time = color_change["start"] - line.start_time
-                end_time = color_change["end"] - line.start_time
+                start_time = start - line.start_time
+                end_time = end - line.start_time
 
                 # We don't want to have times = 0
                 start_time = 1 if start_time == 0 else start_time
@@ -519,15 +903,15 @@ class ColorUtility:
 
                 transform += "\\t(%d,%d," % (start_time, end_time)
 
-                if color_change["acc"] != 1:
-                    transform += str(color_change["acc"])
+                if acc != 1:
+                    transform += str(acc)
 
-                if c1 and color_change["c1"]:
-                    transform += color_change["c1"]
-                if c3 and color_change["c3"]:
-                    transform += color_change["c3"]
-                if c4 and color_change["c4"]:
-                    transform += color_change["c4"]
+                if c1 and change_c1:
+                    transform += change_c1
+                if c3 and change_c3:
+                    transform += change_c3
+                if c4 and change_c4:
+                    transform += change_c4
 
                 transform += ")"
 
@@ -576,19 +960,32 @@ class ColorUtility:
             c3 = self.c3_req
         if c4 is None:
             c4 = self.c4_req
+        if not (c1 or c3 or c4):
+            return ""
+
+        # Frame-by-frame effects ask for the same colors many times (e.g. once per syllable),
+        # so results are cached, keyed by everything they depend on.
+        # Frames are usually processed in order, so the cache is just emptied once full
+        style = line.styleref
+        key = (line.start_time, c1, c3, c4, style.color1, style.color3, style.color4)
+        fr_colors = self._fr_colors
+        colors = fr_colors.get(key)
+        if colors is None:
+            if len(fr_colors) >= _FR_COLORS_CACHE_SIZE:
+                fr_colors.clear()
+            colors = fr_colors[key] = self._compute_fr_color_change(
+                line.start_time, style, c1, c3, c4
+            )
+        return colors
 
+    def _compute_fr_color_change(
+        self, current_time: int, style: Style, c1: bool, c3: bool, c4: bool
+    ) -> str:
         # Reading default colors
-        base_c1 = "\\1c" + line.styleref.color1
-        base_c3 = "\\3c" + line.styleref.color3
-        base_c4 = "\\4c" + line.styleref.color4
+        base_c1, base_c3, base_c4 = self._get_base_colors(style)
 
         # Searching valid color_change
-        current_time = line.start_time
-        latest_index = -1
-
-        for i, color_change in enumerate(self.color_changes):
-            if current_time >= color_change["start"]:
-                latest_index = i
+        latest_index = bisect_right(self._starts, current_time) - 1
 
         # If no color change is found, take default from style
         if latest_index == -1:
@@ -601,72 +998,50 @@ class ColorUtility:
                 colors += base_c4
             return colors
 
+        latest_c1 = self._c1s[latest_index]
+        latest_c3 = self._c3s[latest_index]
+        latest_c4 = self._c4s[latest_index]
+        latest_acc = self._accs[latest_index]
+
         # If we have passed the end of the lastest color change available, then take the final values of it
-        if current_time >= self.color_changes[latest_index]["end"]:
+        if current_time >= self._ends[latest_index]:
             colors = ""
-            if c1 and self.color_changes[latest_index]["c1"]:
-                colors += self.color_changes[latest_index]["c1"]
-            if c3 and self.color_changes[latest_index]["c3"]:
-                colors += self.color_changes[latest_index]["c3"]
-            if c4 and self.color_changes[latest_index]["c4"]:
-                colors += self.color_changes[latest_index]["c4"]
+            if c1 and latest_c1:
+                colors += latest_c1
+            if c3 and latest_c3:
+                colors += latest_c3
+            if c4 and latest_c4:
+                colors += latest_c4
             return colors
 
         # Else, interpolate the latest color change
-        start = current_time - self.color_changes[latest_index]["start"]
-        end = (
-            self.color_changes[latest_index]["end"]
-            - self.color_changes[latest_index]["start"]
-        )
+        start = current_time - self._starts[latest_index]
+        end = self._ends[latest_index] - self._starts[latest_index]
         pct = start / end
 
         # If we're in the first color_change, interpolate with base colors
         if latest_index == 0:
             colors = ""
-            if c1 and self.color_changes[latest_index]["c1"]:
-                colors += "\\1c" + Utils.interpolate(
-                    pct,
-                    base_c1[3:],
-                    self.color_changes[latest_index]["c1"][3:],
-                    self.color_changes[latest_index]["acc"],
-                )
-            if c3 and self.color_changes[latest_index]["c3"]:
-                colors += "\\3c" + Utils.interpolate(
-                    pct,
-                    base_c3[3:],
-                    self.color_changes[latest_index]["c3"][3:],
-                    self.color_changes[latest_index]["acc"],
-                )
-            if c4 and self.color_changes[latest_index]["c4"]:
-                colors += "\\4c" + Utils.interpolate(
-                    pct,
-                    base_c4[3:],
-                    self.color_changes[latest_index]["c4"][3:],
-                    self.color_changes[latest_index]["acc"],
-                )
+            if c1 and latest_c1:
+                colors += self._interpolate_color(pct, base_c1, latest_c1, latest_acc)
+            if c3 and latest_c3:
+                colors += self._interpolate_color(pct, base_c3, latest_c3, latest_acc)
+            if c4 and latest_c4:
+                colors += self._interpolate_color(pct, base_c4, latest_c4, latest_acc)
             return colors
 
         # Else, we interpolate between current color change and previous
         colors = ""
         if c1:
-            colors += "\\1c" + Utils.interpolate(
-                pct,
-                self.color_changes[latest_index - 1]["c1"][3:],
-                self.color_changes[latest_index]["c1"][3:],
-                self.color_changes[latest_index]["acc"],
+            colors += self._interpolate_color(
+                pct, self._c1s[latest_index - 1], latest_c1, latest_acc
             )
         if c3:
-            colors += "\\3c" + Utils.interpolate(
-                pct,
-                self.color_changes[latest_index - 1]["c3"][3:],
-                self.color_changes[latest_index]["c3"][3:],
-                self.color_changes[latest_index]["acc"],
+            colors += self._interpolate_color(
+                pct, self._c3s[latest_index - 1], latest_c3, latest_acc
             )
         if c4:
-            colors += "\\4c" + Utils.interpolate(
-                pct,
-                self.color_changes[latest_index - 1]["c4"][3:],
-                self.color_changes[latest_index]["c4"][3:],
-                self.color_changes[latest_index]["acc"],
+            colors += self._interpolate_color(
+                pct, self._c4s[latest_index - 1], latest_c4, latest_acc
             )
         return colors
@@ -1,4 +1,5 @@
 import os
+import pytest
 from fractions import Fraction
 from pyonfx import *
 from video_timestamps import FPSTimestamps, RoundingMethod
@@ -19,6 +20,45 @@ def test_interpolation():
     res = Utils.interpolate(0.9, "&H000000&", "&HFFFFFF&")
     assert res == "&HE6E6E6&"
 
+    res = Utils.interpolate(0.5, "&H00000000", "&HFF204080")
+    assert res == "&H80102040"
+
+    res = Utils.interpolate_many([0, 0.5, 0.9], "&H000000&", "&HFFFFFF&")
+    assert res == ["&H000000&", "&H808080&", "&HE6E6E6&"]
+
+    res = Utils.interpolate_rgb(0.9, (0, 0, 0), (255, 255, 255))
+    assert res == "&HE6E6E6&"
+
+    # Numbers are interpolated the same way at the boundaries
+    res = Utils.interpolate(1.0, 46, -94)
+    assert res == -94.0 and isinstance(res, float)
+    assert Utils.interpolate_many([1.0], 46, -94) == [res]
+
+    # A negative acceleration can push colors out of range
+    for val1, val2 in (("&H000000&", "&HFFFFFF&"), ("&H00000000", "&HFFFFFFFF")):
+        with pytest.raises(ValueError):
+            Utils.interpolate(0.5, val1, val2, -1)
+        with pytest.raises(ValueError):
+            Utils.interpolate(0.5, val2, val1, -1)
+        with pytest.raises(ValueError):
+            Utils.interpolate_many([0.5], val1, val2, -1)
+
+    # ASS values are validated at the boundaries too
+    for pct in (0, 1):
+        with pytest.raises(ValueError):
+            Utils.interpolate(pct, "&HFF&", "&H00FF00&")
+        with pytest.raises(ValueError):
+            Utils.interpolate(pct, "xx", "&HFF&")
+
+
+def test_clean_tags():
+    assert Utils.clean_tags("{\\b1}{}{\\i1}Hello{}{\\b0}") == "{\\b1\\i1}Hello{\\b0}"
+    assert Utils.clean_tags("{\\b1{\\i1}Hello") == "{\\b1\\i1}Hello"
+    assert Utils.clean_tags("Hello{\\b1") == "Hello{\\b1"
+    assert Utils.clean_tags("Hello") == "Hello"
+    assert Utils.clean_tags("{\\fnArial}{note}x") == "{\\fnArial}{note}x"
+    assert Utils.clean_tags("{\\rAlt}{TL check}x") == "{\\rAlt}{TL check}x"
+
 
 def test_frame_utility():
     timestamps = FPSTimestamps(RoundingMethod.ROUND, Fraction(1000), Fraction(20))
@@ -52,3 +92,38 @@ def test_frame_utility():
         fsc_values.append(fsc)
 
     assert fsc_values == [112.5, 137.5, 137.5, 112.5]
+
+
+def test_color_utility():
+    # Color changes are applied in temporal order, even if lines are not
+    late = lines[0].copy()
+    late.start_time, late.end_time = 2000, 2500
+    late.raw_text = "{\\1c&H0000FF&}late"
+    early = lines[0].copy()
+    early.start_time, early.end_time = 1000, 1500
+    early.raw_text = "{\\1c&H00FF00&}early"
+    CU = ColorUtility([late, early])
+
+    line = lines[0].copy()
+    line.start_time, line.end_time = 500, 800
+    assert CU.get_color_change(line) == "\\1c&HFFFFFF&"
+    assert CU.get_fr_color_change(line) == "\\1c&HFFFFFF&"
+
+    line.start_time, line.end_time = 1200, 2200
+    assert CU.get_color_change(line) == "\\1c&H00FF00&\\t(800,800,\\1c&H0000FF&)"
+    assert CU.get_fr_color_change(line) == "\\1c&H00FF00&"
+    assert CU.get_color_change(line, c1=False) == ""
+    assert CU.get_fr_color_change(line, c1=False) == ""
+
+    line.start_time, line.end_time = 3000, 4000
+    assert CU.get_color_change(line) == "\\1c&H0000FF&"
+    assert CU.get_fr_color_change(line) == "\\1c&H0000FF&"
+
+    # A negative acceleration can push the interpolated colors out of range
+    accelerated = lines[0].copy()
+    accelerated.start_time, accelerated.end_time = 0, 1000
+    accelerated.raw_text = "{\\t(0,1000,-1,\\1c&H000000&)}x"
+    CU = ColorUtility([accelerated])
+    line.start_time, line.end_time = 500, 800
+    with pytest.raises(ValueError):
+        CU.get_fr_color_change(line)